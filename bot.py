@@ -1,16 +1,21 @@
 import os
 import re
+import heapq
+import itertools
+import asyncio
 import sqlite3
+import threading
 import datetime as dt
-from contextlib import closing
-from collections import defaultdict
 
-import pytz
+from cachetools import TTLCache
+
 from dotenv import load_dotenv
 import discord
 from discord import app_commands
 from discord.ext import commands
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 
 # =========================
 # Config & Constants
@@ -21,26 +26,31 @@ if not TOKEN:
     raise EnvironmentError("DISCORD_TOKEN must be set in your .env file.")
 
 DB_PATH = "auctions.db"
-UTC = pytz.UTC
+UTC = dt.timezone.utc
 TIMESTAMP_REGEX = re.compile(r"<t:(\d+)>")
+AMOUNT_REGEX = re.compile(r"(\d[\d,]*)\s*(k)?\s*(?:upx)?", re.IGNORECASE)
 
-# Channels where the bot will detect listings and accept bids
-AUCTION_CHANNEL_IDS = [
+# Channels where the bot will detect listings and accept bids.
+# frozenset: membership is checked on every message/reaction event.
+AUCTION_CHANNEL_IDS = frozenset({
     1200435807920591008, 1206719103772139630, 1206719174643023923,
     1213557612826595459, 1394009977378574508, 1394010162108432545,
     1231738039496085535, 1254867397366517841, 1259960721152807005,
     1309896571692912651, 1332469120897122454, 1352104013654528120,
     1377038520061001769, 1404870616527667332, 1405294654097981540,
     1405073674448670760
-]
+})
 
 # Reaction used to confirm bids
-CONFIRM_EMOJI_ID = "1365117493919744122"  # replace if needed
+CONFIRM_EMOJI_ID = 1365117493919744122  # replace if needed
 
-# Role mentions for alerts
-ROLE_BIDDER_ID = 1315016261293576345
-ROLE_COLLECTOR_ID = 1314988994580320266
-ROLE_SNIPER_ID   = 1315017025764196483
+# Role mentions for alerts, keyed by the name the alert templates use.
+# on_ready resolves these once per guild into bot.role_mentions.
+ROLE_IDS = {
+    "bidder": 1315016261293576345,
+    "collector": 1314988994580320266,
+    "sniper": 1315017025764196483,
+}
 
 # =========================
 # Discord Setup
@@ -52,42 +62,95 @@ intents.guilds = True
 intents.messages = True
 intents.reactions = True
 
-# In-memory helpers
-outbid_watchers = defaultdict(dict)   # {auction_id: {user_id: True}}
-scheduled_messages = set()            # message_ids with alerts scheduled
-concluded_auctions = set()            # auction_ids concluded via command (no DB schema change)
+# In-memory mirrors of persisted state, loaded in init_db. Hot paths check
+# these; the SQLite tables exist so restarts don't drop subscriptions or
+# re-schedule duplicate alerts.
+# All three mirrors are TTL-bounded: no auction runs anywhere near a week,
+# so entries evaporate on their own and a long-running process never
+# accumulates every auction it ever saw. The DB rows remain the durable copy.
+outbid_watchers = TTLCache(maxsize=4096, ttl=7 * 86400)   # {auction_id: {user_id, ...}}
+scheduled_messages = TTLCache(maxsize=4096, ttl=7 * 86400)  # message_ids with alerts scheduled
+concluded_auctions = TTLCache(maxsize=4096, ttl=7 * 86400)  # concluded via command (no DB schema change)
 
 # =========================
 # Database Helpers
 # =========================
+# Single long-lived connection shared by all helpers. Opening a connection per
+# query throws away SQLite's page cache and pays file-open/WAL-mmap setup on
+# every bid; one connection guarded by a lock avoids all of that. The lock is
+# needed because APScheduler and discord.py callbacks may run off-loop.
+_CONN: sqlite3.Connection | None = None
+_DB_LOCK = threading.Lock()
+
+def _connect() -> sqlite3.Connection:
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None, cached_statements=256)
+        _CONN.row_factory = sqlite3.Row
+        # One-time connection tuning. journal_mode=WAL persists in the DB
+        # header, so none of these need repeating on later connections.
+        _CONN.execute("PRAGMA journal_mode=WAL;")
+        _CONN.execute("PRAGMA synchronous=NORMAL;")
+        _CONN.execute("PRAGMA temp_store=MEMORY;")
+        _CONN.execute("PRAGMA mmap_size=268435456;")
+        _CONN.execute("PRAGMA cache_size=-20000;")  # ~20 MB page cache, kept warm for the process lifetime
+    return _CONN
+
 def db_exec(query, params=()):
-    with closing(sqlite3.connect(DB_PATH)) as conn:
-        conn.execute("PRAGMA journal_mode=WAL;")
-        conn.execute(query, params)
-        conn.commit()
+    with _DB_LOCK:
+        _connect().execute(query, params)
 
 def db_one(query, params=()):
-    with closing(sqlite3.connect(DB_PATH)) as conn:
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-        cur.execute(query, params)
-        return cur.fetchone()
+    with _DB_LOCK:
+        return _connect().execute(query, params).fetchone()
 
 def db_all(query, params=()):
-    with closing(sqlite3.connect(DB_PATH)) as conn:
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-        cur.execute(query, params)
-        return cur.fetchall()
+    with _DB_LOCK:
+        return _connect().execute(query, params).fetchall()
+
+# Async wrappers so coroutines never run SQLite I/O on the event loop; the
+# query executes on a worker thread while the loop keeps servicing Discord
+# traffic. The lock inside the sync helpers keeps the shared connection safe.
+async def adb_exec(query, params=()):
+    await asyncio.to_thread(db_exec, query, params)
+
+async def adb_one(query, params=()):
+    return await asyncio.to_thread(db_one, query, params)
+
+async def adb_all(query, params=()):
+    return await asyncio.to_thread(db_all, query, params)
+
+# Hot-path SQL as module constants: sqlite3 caches prepared statements per
+# connection keyed on the exact query string, so reusing one string object
+# guarantees the parse/plan happens once for the connection's lifetime.
+SQL_GET_AUCTION = "SELECT * FROM auctions WHERE auction_id = ?"
+SQL_RECORD_BID = "INSERT INTO bids (auction_id, user_id, amount, bid_time_utc, bid_time_epoch) VALUES (?, ?, ?, ?, ?)"
+# Auction row + current top bid in one round-trip for the bid hot path;
+# top_user is NULL when the auction exists but has no bids yet.
+SQL_AUCTION_WITH_TOP = """
+SELECT a.auction_id, b.user_id AS top_user, b.amount AS top_amount
+FROM auctions a
+LEFT JOIN (
+    SELECT user_id, amount FROM bids
+    WHERE auction_id = ? ORDER BY amount DESC, bid_time_epoch ASC LIMIT 1
+) b
+WHERE a.auction_id = ?
+"""
+
+def _table_columns(table: str) -> set[str]:
+    return {row["name"] for row in db_all(f"PRAGMA table_info({table})")}
 
 def init_db():
+    _connect()
     db_exec("""
     CREATE TABLE IF NOT EXISTS auctions (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         auction_id TEXT NOT NULL UNIQUE,
         message_id TEXT,
         channel_id TEXT,
+        guild_id TEXT,
         end_time_utc TEXT,
+        end_time_epoch INTEGER,
         created_at_utc TEXT DEFAULT (datetime('now'))
     );
     """)
@@ -95,75 +158,197 @@ def init_db():
     CREATE TABLE IF NOT EXISTS bids (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         auction_id TEXT NOT NULL,
-        user_id TEXT NOT NULL,
+        user_id INTEGER NOT NULL,
         amount INTEGER NOT NULL,
         bid_time_utc TEXT DEFAULT (datetime('now')),
+        bid_time_epoch INTEGER,
         FOREIGN KEY (auction_id) REFERENCES auctions(auction_id)
     );
     """)
+    # Migrate pre-epoch databases in place. Queries compare the integer epoch
+    # columns so SQLite does index range scans instead of parsing ISO text
+    # per row; the TEXT columns stay for display.
+    if "guild_id" not in _table_columns("auctions"):
+        db_exec("ALTER TABLE auctions ADD COLUMN guild_id TEXT;")
+    if "end_time_epoch" not in _table_columns("auctions"):
+        db_exec("ALTER TABLE auctions ADD COLUMN end_time_epoch INTEGER;")
+        db_exec("UPDATE auctions SET end_time_epoch = CAST(strftime('%s', end_time_utc) AS INTEGER) WHERE end_time_utc IS NOT NULL;")
+    if "bid_time_epoch" not in _table_columns("bids"):
+        db_exec("ALTER TABLE bids ADD COLUMN bid_time_epoch INTEGER;")
+        db_exec("UPDATE bids SET bid_time_epoch = CAST(strftime('%s', bid_time_utc) AS INTEGER);")
+    # user_id used to be TEXT; the code now keeps Discord IDs as ints all the
+    # way through, so rebuild legacy tables once (SQLite can't retype a
+    # column in place). TEXT affinity would otherwise stringify every insert.
+    user_id_type = next(r["type"] for r in db_all("PRAGMA table_info(bids)") if r["name"] == "user_id")
+    if user_id_type.upper() != "INTEGER":
+        db_exec("ALTER TABLE bids RENAME TO bids_legacy;")
+        db_exec("""
+        CREATE TABLE bids (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            auction_id TEXT NOT NULL,
+            user_id INTEGER NOT NULL,
+            amount INTEGER NOT NULL,
+            bid_time_utc TEXT DEFAULT (datetime('now')),
+            bid_time_epoch INTEGER,
+            FOREIGN KEY (auction_id) REFERENCES auctions(auction_id)
+        );
+        """)
+        db_exec("""
+        INSERT INTO bids (id, auction_id, user_id, amount, bid_time_utc, bid_time_epoch)
+        SELECT id, auction_id, CAST(user_id AS INTEGER), amount, bid_time_utc, bid_time_epoch FROM bids_legacy;
+        """)
+        db_exec("DROP TABLE bids_legacy;")
+    db_exec("""
+    CREATE TABLE IF NOT EXISTS outbid_watchers (
+        auction_id TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        PRIMARY KEY (auction_id, user_id)
+    );
+    """)
+    db_exec("""
+    CREATE TABLE IF NOT EXISTS scheduled_alerts (
+        message_id TEXT PRIMARY KEY
+    );
+    """)
     db_exec("CREATE INDEX IF NOT EXISTS idx_bids_auction ON bids(auction_id);")
-    db_exec("CREATE INDEX IF NOT EXISTS idx_bids_time ON bids(bid_time_utc);")
+    # Covering index: the top-bid lookup (filter by auction_id, order by
+    # amount/time, read user_id) is answered by one index descent with no
+    # sort and no table access. idx_bids_time served no query; drop it.
+    db_exec("DROP INDEX IF EXISTS idx_bids_time;")
+    db_exec("DROP INDEX IF EXISTS idx_bids_auction_amount_time;")
+    db_exec("CREATE INDEX IF NOT EXISTS idx_bids_top ON bids(auction_id, amount DESC, bid_time_epoch ASC, user_id);")
+    # Drop persisted alert markers whose auction ended over a week ago,
+    # then rehydrate the in-memory mirrors
+    db_exec("""
+    DELETE FROM scheduled_alerts WHERE message_id IN (
+        SELECT auction_id FROM auctions WHERE end_time_epoch < strftime('%s', 'now') - 7 * 86400
+    );
+    """)
+    db_exec("""
+    DELETE FROM outbid_watchers WHERE auction_id IN (
+        SELECT auction_id FROM auctions WHERE end_time_epoch < strftime('%s', 'now') - 7 * 86400
+    );
+    """)
+    for row in db_all("SELECT auction_id, user_id FROM outbid_watchers"):
+        outbid_watchers.setdefault(row["auction_id"], set()).add(int(row["user_id"]))
+    for row in db_all("SELECT message_id FROM scheduled_alerts"):
+        scheduled_messages[int(row["message_id"])] = True
 
 # =========================
 # Utilities
 # =========================
 def iso_utc(dt_obj: dt.datetime) -> str:
+    # UTC-aware datetimes (the normal case) serialize directly; anything else
+    # is localized/converted first. timezone.utc is a C-level singleton, so
+    # the identity check is free.
+    if dt_obj.tzinfo is UTC:
+        return dt_obj.isoformat()
     if dt_obj.tzinfo is None:
-        dt_obj = pytz.UTC.localize(dt_obj)
-    return dt_obj.astimezone(pytz.UTC).isoformat()
+        dt_obj = dt_obj.replace(tzinfo=UTC)
+    return dt_obj.astimezone(UTC).isoformat()
 
 def parse_amount(text: str) -> int:
-    text = text.lower().replace(",", "").replace("upx", "").replace("$", "")
-    m = re.search(r"(\d+)(k)?", text)
+    # One pre-compiled, case-insensitive scan over the raw message; the old
+    # lower()/replace() chain copied the whole string four times per bid.
+    m = AMOUNT_REGEX.search(text)
     if not m:
         raise ValueError("no amount")
-    n = int(m.group(1))
-    return n * 1000 if m.group(2) == "k" else n
-
-def get_auction(auction_id: str):
-    return db_one("SELECT * FROM auctions WHERE auction_id = ?", (auction_id,))
-
-def upsert_pending(auction_id: str, message_id: str, channel_id: str, end_time_utc: str):
-    existing = get_auction(auction_id)
-    if not existing:
-        db_exec(
-            "INSERT INTO auctions (auction_id, message_id, channel_id, end_time_utc) VALUES (?, ?, ?, ?)",
-            (auction_id, message_id, channel_id, end_time_utc),
-        )
-    elif not existing["end_time_utc"]:
-        db_exec("UPDATE auctions SET end_time_utc=? WHERE auction_id=?", (end_time_utc, auction_id))
-
-def record_bid(auction_id: str, user_id: int, amount: int, when: dt.datetime | None = None):
-    when = when or dt.datetime.now(pytz.UTC)
-    db_exec(
-        "INSERT INTO bids (auction_id, user_id, amount, bid_time_utc) VALUES (?, ?, ?, ?)",
-        (auction_id, str(user_id), amount, iso_utc(when)),
-    )
-
-def best_bid_now(auction_id: str):
-    return db_one(
-        "SELECT user_id, amount, bid_time_utc FROM bids WHERE auction_id=? ORDER BY amount DESC, datetime(bid_time_utc) ASC LIMIT 1",
-        (auction_id,),
+    n = int(m.group(1).replace(",", ""))
+    return n * 1000 if m.group(2) else n
+
+# Auction rows rarely change after registration but are read on every bid and
+# reaction; cache them per auction_id (misses included) and invalidate on the
+# writes that can change a row. Bounded by wholesale clear — auctions are few.
+_AUCTION_CACHE_MAX = 512
+_auction_cache: dict[str, sqlite3.Row | None] = {}
+_auction_cache_lock = threading.Lock()
+
+def _invalidate_auction(auction_id: str):
+    with _auction_cache_lock:
+        _auction_cache.pop(auction_id, None)
+
+async def get_auction(auction_id: str):
+    with _auction_cache_lock:
+        if auction_id in _auction_cache:
+            return _auction_cache[auction_id]
+    row = await adb_one(SQL_GET_AUCTION, (auction_id,))
+    with _auction_cache_lock:
+        if len(_auction_cache) >= _AUCTION_CACHE_MAX:
+            _auction_cache.clear()
+        _auction_cache[auction_id] = row
+    return row
+
+async def upsert_pending(auction_id: str, message_id: str, channel_id: str, guild_id: str, end_time_utc: str, end_time_epoch: int):
+    # Single upsert instead of SELECT + INSERT/UPDATE: one transaction, one
+    # WAL append, and no read-modify-write race. end_time_utc only fills in
+    # when it wasn't already known, matching the old conditional UPDATE.
+    await adb_exec(
+        """
+        INSERT INTO auctions (auction_id, message_id, channel_id, guild_id, end_time_utc, end_time_epoch)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(auction_id) DO UPDATE SET
+            end_time_utc = excluded.end_time_utc,
+            end_time_epoch = excluded.end_time_epoch
+        WHERE auctions.end_time_utc IS NULL
+        """,
+        (auction_id, message_id, channel_id, guild_id, end_time_utc, end_time_epoch),
     )
+    _invalidate_auction(auction_id)
+    # A new listing may change which auction is active for the channel,
+    # including flipping a cached "no active auction" entry.
+    auction_mgr.invalidate(channel_id)
 
-def best_bid_before_end(auction_id: str):
-    return db_one(
+async def best_bid_before_end(auction_id: str):
+    return await adb_one(
         """
         SELECT b.user_id, b.amount, b.bid_time_utc
         FROM bids b JOIN auctions a ON a.auction_id = b.auction_id
-        WHERE b.auction_id = ? AND datetime(b.bid_time_utc) <= datetime(a.end_time_utc)
-        ORDER BY b.amount DESC, datetime(b.bid_time_utc) ASC LIMIT 1
+        WHERE b.auction_id = ? AND b.bid_time_epoch <= a.end_time_epoch
+        ORDER BY b.amount DESC, b.bid_time_epoch ASC LIMIT 1
         """,
         (auction_id,),
     )
 
+def _place_bid_txn(auction_id: str, user_id: int, amount: int):
+    """Existence check, highest-bid check, and insert as one transaction.
+
+    Runs on a worker thread (see confirm_bid). A single BEGIN IMMEDIATE /
+    COMMIT means one WAL append per accepted bid instead of three autocommit
+    transactions, and a concurrent bid can't sneak in between the check and
+    the insert. Returns ("missing"|"too_low"|"ok", previous_best_row).
+    """
+    with _DB_LOCK:
+        conn = _connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(SQL_AUCTION_WITH_TOP, (auction_id, auction_id)).fetchone()
+            if not row:
+                conn.execute("ROLLBACK")
+                return "missing", None
+            current = None
+            if row["top_user"] is not None:
+                current = {"user_id": row["top_user"], "amount": row["top_amount"]}
+            if current and amount <= current["amount"]:
+                conn.execute("ROLLBACK")
+                return "too_low", current
+            now = dt.datetime.now(UTC)
+            conn.execute(SQL_RECORD_BID, (auction_id, user_id, amount, iso_utc(now), int(now.timestamp())))
+            conn.execute("COMMIT")
+            return "ok", current
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
 # =========================
 # Auction Manager (runtime cache)
 # =========================
 class AuctionManager:
     """Caches a single 'active' auction per channel for consistent lookups without DB schema changes."""
+
+    _MISS = object()  # distinguishes "never looked up" from a cached None
+
     def __init__(self):
-        self.active_by_channel: dict[str, str] = {}  # channel_id -> auction_id
+        self.active_by_channel: dict[str, str | None] = {}  # channel_id -> auction_id (None = known empty)
 
     def activate(self, channel_id: int | str, auction_id: int | str):
         self.active_by_channel[str(channel_id)] = str(auction_id)
@@ -173,19 +358,24 @@ class AuctionManager:
         if self.active_by_channel.get(ch) == str(auction_id):
             self.active_by_channel.pop(ch, None)
 
-    def get_active_for_channel(self, channel_id: int | str) -> str | None:
-        a = self.active_by_channel.get(str(channel_id))
-        if a:
+    def invalidate(self, channel_id: int | str):
+        self.active_by_channel.pop(str(channel_id), None)
+
+    async def get_active_for_channel(self, channel_id: int | str) -> str | None:
+        ch = str(channel_id)
+        a = self.active_by_channel.get(ch, self._MISS)
+        if a is not self._MISS:
             return a
-        # Fallback: pick most recent auction listing for this channel (by created_at_utc)
-        row = db_one(
+        # Fallback: pick most recent auction listing for this channel (by
+        # created_at_utc). Cache a None result too — otherwise every message
+        # in an idle channel re-runs this query.
+        row = await adb_one(
             "SELECT auction_id FROM auctions WHERE channel_id=? ORDER BY datetime(created_at_utc) DESC LIMIT 1",
-            (str(channel_id),),
+            (ch,),
         )
-        if row:
-            self.activate(channel_id, row["auction_id"])
-            return row["auction_id"]
-        return None
+        auction_id = row["auction_id"] if row else None
+        self.active_by_channel[ch] = auction_id
+        return auction_id
 
 auction_mgr = AuctionManager()
 
@@ -195,44 +385,149 @@ auction_mgr = AuctionManager()
 class AuctionBot(commands.Bot):
     def __init__(self):
         super().__init__(command_prefix='/', intents=intents)
-        self.scheduler = AsyncIOScheduler()
-        self.reminders = {}
+        # Persist jobs in the auction DB so alerts and reminders survive a
+        # restart; the apscheduler_jobs table coexists with auctions/bids,
+        # and WAL mode keeps its writes from blocking auction reads.
+        # Explicit async executor (no thread pool) and coalescing defaults:
+        # after downtime a job fires once instead of replaying a backlog,
+        # and max_instances=1 stops the alert tick overlapping itself.
+        self.scheduler = AsyncIOScheduler(
+            jobstores={"default": SQLAlchemyJobStore(url=f"sqlite:///{DB_PATH}")},
+            executors={"default": AsyncIOExecutor()},
+            job_defaults={"coalesce": True, "misfire_grace_time": 60, "max_instances": 1},
+        )
+        # Reminder metadata is never cleaned up after jobs fire; TTL-bound it
+        # like scheduled_messages so long uptimes don't accumulate entries.
+        self.reminders = TTLCache(maxsize=4096, ttl=7 * 86400)
+        # guild_id -> {"bidder"/"collector"/"sniper": mention string},
+        # resolved once in on_ready so alerts don't re-do role lookups
+        self.role_mentions = {}
+        # Per-guild alert message templates, pre-rendered in on_ready with
+        # role mentions baked in; alerts only fill the {jump} placeholder.
+        self.alert_templates = {}
 
     async def setup_hook(self):
+        # Eager tasks (3.12+) skip the schedule-then-run bookkeeping for
+        # coroutines that finish synchronously — common for the short
+        # fire-and-forget DM/alert tasks this bot spawns.
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
         await self.tree.sync()
         self.scheduler.start()
+        self.scheduler.add_job(
+            dispatch_due_alerts, "interval", seconds=30,
+            id="alert_tick", replace_existing=True,
+        )
 
 bot = AuctionBot()
 
+# User objects resolved for DMs; bot.get_user hits discord.py's own cache,
+# bot.fetch_user is an HTTP round-trip we only want to pay once per user.
+_user_cache: dict[int, discord.User] = {}
+
+async def get_cached_user(user_id: int) -> discord.User:
+    user = _user_cache.get(user_id)
+    if user is None:
+        user = bot.get_user(user_id) or await bot.fetch_user(user_id)
+        _user_cache[user_id] = user
+    return user
+
+# user.send() lazily creates the DM channel with a REST call the first time;
+# keep the resolved channel so repeat DMs to the same user skip that trip.
+_dm_channel_cache: dict[int, discord.DMChannel] = {}
+
+async def get_dm_channel(user: discord.User) -> discord.DMChannel:
+    ch = _dm_channel_cache.get(user.id)
+    if ch is None:
+        ch = user.dm_channel or await user.create_dm()
+        _dm_channel_cache[user.id] = ch
+    return ch
+
+async def _safe_dm(user_id: int, text: str):
+    """DM a user, swallowing the failures a DM can legitimately hit.
+
+    Runs as a fire-and-forget task so callers (slash-command handlers in
+    particular) never wait out a DM round-trip or a rate-limit retry.
+    """
+    try:
+        user = await get_cached_user(user_id)
+        await (await get_dm_channel(user)).send(text)
+    except (discord.Forbidden, discord.HTTPException):
+        pass
+
 # =========================
 # Alerts
 # =========================
-async def send_halfway_alert(channel_id, message_id):
-    channel = bot.get_channel(int(channel_id))
-    if not channel:
-        return
-    bidder_role = channel.guild.get_role(ROLE_BIDDER_ID)
-    collector_role = channel.guild.get_role(ROLE_COLLECTOR_ID)
-    try:
-        msg = await channel.fetch_message(int(message_id))
-    except Exception:
+# Pending alerts as a plain heap drained by one periodic tick, instead of two
+# persisted scheduler date-jobs per auction: scheduling is a heap push, and
+# the scheduler holds a single job no matter how many auctions are live.
+# The heap is rebuilt from auctions + scheduled_alerts at startup.
+_alert_heap: list[tuple[float, str, int, int]] = []  # (fire_at_epoch, kind, channel_id, message_id)
+_alerts_rehydrated = False
+
+def schedule_alerts(channel_id: int, message_id: int, half_at: float, one_hour_at: float):
+    heapq.heappush(_alert_heap, (half_at, "halftime", channel_id, message_id))
+    heapq.heappush(_alert_heap, (one_hour_at, "one_hour", channel_id, message_id))
+
+async def dispatch_due_alerts():
+    now = dt.datetime.now(UTC).timestamp()
+    while _alert_heap and _alert_heap[0][0] <= now:
+        _, kind, channel_id, message_id = heapq.heappop(_alert_heap)
+        if str(message_id) in concluded_auctions:
+            continue
+        # One bad channel (Forbidden after a permission change, transient
+        # HTTP error) must not eat the popped alert's siblings or delay the
+        # rest of the due entries until the next tick.
+        try:
+            await send_alert(kind, channel_id, message_id)
+        except Exception as e:
+            print(f"⚠️ Failed to send {kind} alert for {message_id} in {channel_id}: {e}")
+
+async def rehydrate_alert_heap():
+    """Re-derive pending alert times after a restart.
+
+    Halfway/one-hour times are pure arithmetic over created_at/end_time, so
+    nothing beyond the existing scheduled_alerts markers needs persisting.
+    """
+    global _alerts_rehydrated
+    if _alerts_rehydrated:
         return
-    await channel.send(
-        f"⏳ {bidder_role.mention if bidder_role else ''} {collector_role.mention if collector_role else ''} — This auction is at **halftime**!\n{msg.jump_url}"
+    _alerts_rehydrated = True
+    now = dt.datetime.now(UTC).timestamp()
+    rows = await adb_all(
+        """
+        SELECT a.channel_id, a.auction_id,
+               CAST(strftime('%s', a.created_at_utc) AS INTEGER) AS created_epoch,
+               a.end_time_epoch
+        FROM auctions a JOIN scheduled_alerts s ON s.message_id = a.auction_id
+        WHERE a.end_time_epoch > strftime('%s', 'now') AND a.channel_id IS NOT NULL
+        """
     )
-
-async def send_one_hour_alert(channel_id, message_id):
+    for row in rows:
+        half_at = row["created_epoch"] + (row["end_time_epoch"] - row["created_epoch"]) / 2
+        one_hour_at = row["end_time_epoch"] - 3600
+        if half_at > now:
+            heapq.heappush(_alert_heap, (half_at, "halftime", int(row["channel_id"]), int(row["auction_id"])))
+        if one_hour_at > now:
+            heapq.heappush(_alert_heap, (one_hour_at, "one_hour", int(row["channel_id"]), int(row["auction_id"])))
+
+def jump_url(guild_id, channel_id, message_id) -> str:
+    return f"https://discord.com/channels/{guild_id}/{channel_id}/{message_id}"
+
+# Mention-free fallbacks for guilds joined after startup (no pre-rendered
+# templates yet); same keys as bot.alert_templates.
+_FALLBACK_ALERT_TEMPLATES = {
+    "halftime": "⏳ This auction is at **halftime**!\n{jump}",
+    "one_hour": "🎯 **1 hour remaining**! Final bids incoming!\n{jump}",
+}
+
+async def send_alert(kind: str, channel_id, message_id):
     channel = bot.get_channel(int(channel_id))
     if not channel:
         return
-    sniper_role = channel.guild.get_role(ROLE_SNIPER_ID)
-    try:
-        msg = await channel.fetch_message(int(message_id))
-    except Exception:
-        return
-    await channel.send(
-        f"🎯 {sniper_role.mention if sniper_role else ''} — **1 hour remaining**! Final bids incoming!\n{msg.jump_url}"
-    )
+    tmpl = bot.alert_templates.get(channel.guild.id, _FALLBACK_ALERT_TEMPLATES).get(kind) or _FALLBACK_ALERT_TEMPLATES[kind]
+    # jump_url is pure string math — no need to fetch the message for it
+    await channel.send(tmpl.format(jump=jump_url(channel.guild.id, channel_id, message_id)))
 
 # =========================
 # Core Actions
@@ -253,9 +548,9 @@ async def confirm_bid(
             await channel.send(text)
         return
 
-    # Validate auction existence
-    auction = get_auction(auction_id)
-    if not auction:
+    # Validate + enforce higher-than-current + persist in one transaction
+    status, current = await asyncio.to_thread(_place_bid_txn, auction_id, bidder.id, amount)
+    if status == "missing":
         text = f"⚠️ Auction `{auction_id}` is not registered. Use `/track_auction {auction_id}` to activate."
         if interaction and not interaction.response.is_done():
             await interaction.response.send_message(text, ephemeral=True)
@@ -263,9 +558,7 @@ async def confirm_bid(
             await channel.send(text)
         return
 
-    # Enforce higher-than-current bid
-    current = best_bid_now(auction_id)
-    if current and amount <= current["amount"]:
+    if status == "too_low":
         msg = f"⚠️ Bid must be higher than the current bid ({current['amount']:,})."
         if interaction and not interaction.response.is_done():
             await interaction.response.send_message(msg, ephemeral=True)
@@ -273,20 +566,18 @@ async def confirm_bid(
             await channel.send(msg)
         return
 
-    # Persist bid
-    record_bid(auction_id, bidder.id, amount)
-
-    # Notify outbid watchers
+    # Notify outbid watchers (user_id comes back from SQLite as int)
     prev_bidder_id = current["user_id"] if current else None
-    if prev_bidder_id and int(prev_bidder_id) in outbid_watchers[auction_id]:
-        try:
-            prev_user = await bot.fetch_user(int(prev_bidder_id))
-            await prev_user.send(
-                f"You’ve been outbid in auction `{auction_id}`.\nNew high bid: {amount:,} by {bidder.display_name}."
-            )
-        except discord.Forbidden:
-            pass
-        outbid_watchers[auction_id].pop(int(prev_bidder_id), None)
+    watchers = outbid_watchers.get(auction_id)
+    if prev_bidder_id and watchers and prev_bidder_id in watchers:
+        # Fire-and-forget: the confirmation reply must go out within the
+        # interaction's 3-second window and shouldn't wait on a DM round-trip.
+        asyncio.create_task(_safe_dm(
+            prev_bidder_id,
+            f"You’ve been outbid in auction `{auction_id}`.\nNew high bid: {amount:,} by {bidder.display_name}.",
+        ))
+        watchers.discard(prev_bidder_id)
+        await adb_exec("DELETE FROM outbid_watchers WHERE auction_id=? AND user_id=?", (auction_id, str(prev_bidder_id)))
 
     # Acknowledge
     ack = f"✅ {bidder.display_name} confirmed at {amount:,} for `{auction_id}`."
@@ -301,7 +592,8 @@ async def confirm_bid(
 @bot.tree.command(name="notify_outbid", description="DM you if you're outbid on an auction.")
 @app_commands.describe(auction_id="Auction ID to watch (the listing message ID).")
 async def notify_outbid_cmd(interaction: discord.Interaction, auction_id: str):
-    outbid_watchers[auction_id][interaction.user.id] = True
+    outbid_watchers.setdefault(auction_id, set()).add(interaction.user.id)
+    await adb_exec("INSERT OR IGNORE INTO outbid_watchers (auction_id, user_id) VALUES (?, ?)", (auction_id, str(interaction.user.id)))
     await interaction.response.send_message(
         f"🔔 You'll be DMed if you're outbid in `{auction_id}`.", ephemeral=True
     )
@@ -319,7 +611,7 @@ async def cb_cmd(
     auction_id: str | None = None
 ):
     # Use provided auction_id or fall back to the channel's active listing
-    auction_id = auction_id or auction_mgr.get_active_for_channel(interaction.channel_id)
+    auction_id = auction_id or await auction_mgr.get_active_for_channel(interaction.channel_id)
     if not auction_id:
         await interaction.response.send_message(
             "⚠️ No active auction found for this channel. Use `/track_auction <message_id>` first.",
@@ -328,6 +620,12 @@ async def cb_cmd(
         return
     await confirm_bid(bidder, amount, str(auction_id), interaction=interaction)
 
+# Reminder job ids: a counter makes collisions impossible within a run, and
+# the once-per-process epoch prefix keeps new ids distinct from reminders a
+# previous run left behind in the persistent jobstore.
+_job_counter = itertools.count()
+_JOB_ID_PREFIX = f"r{int(dt.datetime.now(UTC).timestamp())}_"
+
 @bot.tree.command(name="set_reminder", description="DM reminder for an auction")
 async def set_reminder_cmd(
     interaction: discord.Interaction,
@@ -338,8 +636,12 @@ async def set_reminder_cmd(
     if hours == 0 and minutes == 0:
         await interaction.response.send_message("⏳ Provide at least hours or minutes.", ephemeral=True)
         return
-    run_time = dt.datetime.utcnow() + dt.timedelta(hours=hours, minutes=minutes)
-    job_id = f"{interaction.user.id}_{auction_id}_{hours}h{minutes}m_{dt.datetime.utcnow().timestamp()}"
+    run_time = dt.datetime.now(UTC) + dt.timedelta(hours=hours, minutes=minutes)
+    # The invoker is right here — warm the user cache so the reminder fire
+    # never needs a get_user/fetch_user lookup.
+    _user_cache[interaction.user.id] = interaction.user
+    # Short counter-based id; the descriptive details live in bot.reminders.
+    job_id = f"{_JOB_ID_PREFIX}{next(_job_counter)}"
     bot.reminders[job_id] = {"auction_id": auction_id, "user_id": interaction.user.id}
     bot.scheduler.add_job(
         send_reminder_dm,
@@ -353,27 +655,53 @@ async def set_reminder_cmd(
     )
 
 async def send_reminder_dm(user_id, auction_id):
-    user = await bot.fetch_user(user_id)
+    user = await get_cached_user(user_id)
     if user:
-        await user.send(f"⏰ Reminder: Auction '{auction_id}' is coming to a close soon!")
+        ch = await get_dm_channel(user)
+        await ch.send(f"⏰ Reminder: Auction '{auction_id}' is coming to a close soon!")
 
 @bot.tree.command(name="track_auction", description="Activate a detected auction by message_id")
-@app_commands.describe(message_id="The message ID of the auction post (<t:UNIX> inside).")
-async def track_cmd(interaction: discord.Interaction, message_id: str):
-    # Validate channel
-    # Search all known auction channels for the message
+@app_commands.describe(
+    message_id="The message ID of the auction post (<t:UNIX> inside).",
+    channel="Channel containing the post (skips the lookup entirely).",
+)
+async def track_cmd(interaction: discord.Interaction, message_id: str, channel: discord.TextChannel | None = None):
+    # message_id is free-text from the user; validate once up front instead
+    # of letting a pasted non-ID blow up mid-lookup.
+    try:
+        msg_id = int(message_id)
+    except ValueError:
+        await interaction.response.send_message("❌ Message not found in auction channels.", ephemeral=True)
+        return
+
+    # Fastest path: the caller told us the channel outright.
     target_msg = None
-    for ch_id in AUCTION_CHANNEL_IDS:
-        ch = interaction.client.get_channel(ch_id)
-        if not ch:
-            continue
+    if channel is not None:
         try:
-            m = await ch.fetch_message(int(message_id))
-            if m:
-                target_msg = m
-                break
+            target_msg = await channel.fetch_message(msg_id)
         except Exception:
-            continue
+            target_msg = None
+
+    # on_message usually upserted the listing already, so the DB knows its
+    # channel — one targeted fetch instead of probing every auction channel.
+    row = None if target_msg else await get_auction(message_id)
+    if row and row["channel_id"]:
+        ch = interaction.client.get_channel(int(row["channel_id"]))
+        if ch:
+            try:
+                target_msg = await ch.fetch_message(msg_id)
+            except Exception:
+                target_msg = None
+
+    if not target_msg:
+        # Fallback: probe all auction channels concurrently rather than one
+        # sequential REST call per channel.
+        channels = [interaction.client.get_channel(ch_id) for ch_id in AUCTION_CHANNEL_IDS]
+        results = await asyncio.gather(
+            *[ch.fetch_message(msg_id) for ch in channels if ch],
+            return_exceptions=True,
+        )
+        target_msg = next((m for m in results if isinstance(m, discord.Message)), None)
 
     if not target_msg:
         await interaction.response.send_message("❌ Message not found in auction channels.", ephemeral=True)
@@ -385,22 +713,22 @@ async def track_cmd(interaction: discord.Interaction, message_id: str):
         return
 
     unix_time = int(match.group(1))
-    end_time = dt.datetime.fromtimestamp(unix_time, tz=pytz.UTC)
+    end_time = dt.datetime.fromtimestamp(unix_time, tz=UTC)
 
     # Register / update
-    upsert_pending(str(target_msg.id), str(target_msg.id), str(target_msg.channel.id), iso_utc(end_time))
+    await upsert_pending(str(target_msg.id), str(target_msg.id), str(target_msg.channel.id), str(target_msg.guild.id), iso_utc(end_time), unix_time)
 
     # Activate this listing for the channel
     auction_mgr.activate(target_msg.channel.id, target_msg.id)
 
     # Schedule alerts if appropriate
-    now = dt.datetime.now(pytz.UTC)
-    if end_time > now + dt.timedelta(hours=1):
-        scheduled_messages.add(target_msg.id)
+    now = dt.datetime.now(UTC)
+    if end_time > now + dt.timedelta(hours=1) and target_msg.id not in scheduled_messages:
+        scheduled_messages[target_msg.id] = True
+        await adb_exec("INSERT OR IGNORE INTO scheduled_alerts (message_id) VALUES (?)", (str(target_msg.id),))
         half_when = now + (end_time - now) / 2
         one_hour_when = end_time - dt.timedelta(hours=1)
-        bot.scheduler.add_job(send_halfway_alert, "date", run_date=half_when, args=[target_msg.channel.id, target_msg.id])
-        bot.scheduler.add_job(send_one_hour_alert, "date", run_date=one_hour_when, args=[target_msg.channel.id, target_msg.id])
+        schedule_alerts(target_msg.channel.id, target_msg.id, half_when.timestamp(), one_hour_when.timestamp())
 
     await interaction.response.send_message(
         f"✅ Auction activated.\n• Auction ID: `{target_msg.id}`\n• Ends: <t:{unix_time}:F> (<t:{unix_time}:R>)",
@@ -410,15 +738,15 @@ async def track_cmd(interaction: discord.Interaction, message_id: str):
 @bot.tree.command(name="final_bid", description="Get the last valid bid at/before auction end")
 @app_commands.describe(auction_id="Auction ID (listing message_id).")
 async def final_bid_cmd(interaction: discord.Interaction, auction_id: str):
-    a = get_auction(auction_id)
+    a = await get_auction(auction_id)
     if not a:
         await interaction.response.send_message(f"❌ Auction `{auction_id}` not found.", ephemeral=True)
         return
-    row = best_bid_before_end(auction_id)
+    row = await best_bid_before_end(auction_id)
     if not row:
         await interaction.response.send_message(f"No valid bids found for `{auction_id}`.", ephemeral=True)
         return
-    jump = f"https://discord.com/channels/{interaction.guild_id}/{a['channel_id']}/{a['message_id']}" if a["channel_id"] and a["message_id"] else ""
+    jump = jump_url(interaction.guild_id, a["channel_id"], a["message_id"]) if a["channel_id"] and a["message_id"] else ""
     await interaction.response.send_message(
         f"🏁 Final bid for `{auction_id}`: **{row['amount']:,}** by <@{row['user_id']}> (at {row['bid_time_utc']} UTC)\n{jump}",
         ephemeral=True
@@ -427,11 +755,11 @@ async def final_bid_cmd(interaction: discord.Interaction, auction_id: str):
 @bot.tree.command(name="auction_info", description="Show stored info for an auction")
 @app_commands.describe(auction_id="Auction ID (message_id)")
 async def auction_info_cmd(interaction: discord.Interaction, auction_id: str):
-    a = get_auction(auction_id)
+    a = await get_auction(auction_id)
     if not a:
         await interaction.response.send_message("❌ Not found.", ephemeral=True)
         return
-    jump = f"https://discord.com/channels/{interaction.guild_id}/{a['channel_id']}/{a['message_id']}" if a["channel_id"] and a["message_id"] else ""
+    jump = jump_url(interaction.guild_id, a["channel_id"], a["message_id"]) if a["channel_id"] and a["message_id"] else ""
     await interaction.response.send_message(
         f"🗂 **Auction** `{auction_id}`\n• Ends (UTC): `{a['end_time_utc']}`\n{jump}",
         ephemeral=True
@@ -443,13 +771,16 @@ async def auction_info_cmd(interaction: discord.Interaction, auction_id: str):
     message="Custom message to announce."
 )
 async def conclude_auction_cmd(interaction: discord.Interaction, auction_id: str, message: str):
-    a = get_auction(auction_id)
+    a = await get_auction(auction_id)
     if not a:
         await interaction.response.send_message(f"❌ Auction `{auction_id}` not found.", ephemeral=True)
         return
 
-    # Mark concluded in memory (no DB schema change)
-    concluded_auctions.add(auction_id)
+    # Mark concluded in memory (no DB schema change) and drop watcher state
+    # eagerly rather than waiting for TTL expiry.
+    concluded_auctions[auction_id] = True
+    outbid_watchers.pop(auction_id, None)
+    await adb_exec("DELETE FROM outbid_watchers WHERE auction_id=?", (auction_id,))
 
     # Deactivate as active for that channel if currently selected
     if a["channel_id"]:
@@ -462,19 +793,40 @@ async def conclude_auction_cmd(interaction: discord.Interaction, auction_id: str
     channel = bot.get_channel(int(a["channel_id"])) if a["channel_id"] else None
     if channel:
         # Try to include the original jump URL
-        jump_url = f"https://discord.com/channels/{interaction.guild_id}/{a['channel_id']}/{a['message_id']}" if a["message_id"] else ""
-        await channel.send(f"🏁 **Auction Concluded** — `{auction_id}`\n{message}\n{jump_url}")
+        jump = jump_url(interaction.guild_id, a["channel_id"], a["message_id"]) if a["message_id"] else ""
+        await channel.send(f"🏁 **Auction Concluded** — `{auction_id}`\n{message}\n{jump}")
 
 # =========================
 # Events
 # =========================
+def _role_mention(guild: discord.Guild, role_id: int) -> str:
+    role = guild.get_role(role_id)
+    return role.mention if role else ""
+
 @bot.event
 async def on_ready():
-    init_db()
+    # init_db runs schema migrations, which can take a moment on an old DB —
+    # keep that off the event loop like every other DB call.
+    await asyncio.to_thread(init_db)
+    await rehydrate_alert_heap()
+
+    # Resolve alert role mentions once per guild; the scheduled alert
+    # callbacks then just read a dict instead of branching on get_role.
+    for guild in bot.guilds:
+        mentions = {
+            name: _role_mention(guild, role_id) for name, role_id in ROLE_IDS.items()
+        }
+        bot.role_mentions[guild.id] = mentions
+        # Bake the fixed parts (mentions included) into ready templates so
+        # each alert fire is a single .format(jump=...) call.
+        bot.alert_templates[guild.id] = {
+            "halftime": f"⏳ {mentions['bidder']} {mentions['collector']} — This auction is at **halftime**!\n{{jump}}",
+            "one_hour": f"🎯 {mentions['sniper']} — **1 hour remaining**! Final bids incoming!\n{{jump}}",
+        }
 
     # Preload "active" auctions for each AUCTION_CHANNEL_ID (latest listing per channel)
     for ch_id in AUCTION_CHANNEL_IDS:
-        row = db_one(
+        row = await adb_one(
             "SELECT auction_id FROM auctions WHERE channel_id=? ORDER BY datetime(created_at_utc) DESC LIMIT 1",
             (str(ch_id),),
         )
@@ -485,42 +837,59 @@ async def on_ready():
 
 @bot.event
 async def on_message(message: discord.Message):
-    await bot.process_commands(message)
-    if message.author.bot or message.id in scheduled_messages:
+    # Reject bot and non-auction-channel traffic before process_commands:
+    # all user-facing commands are slash commands, so for the vast majority
+    # of messages process_commands is pure prefix-parsing overhead.
+    if message.author.bot or message.channel.id not in AUCTION_CHANNEL_IDS:
         return
 
-    if message.channel.id not in AUCTION_CHANNEL_IDS:
-        # Soft feedback so users understand why it's ignored
+    await bot.process_commands(message)
+    if message.id in scheduled_messages:
         return
 
-    # Detect listings with <t:UNIX>
-    m = TIMESTAMP_REGEX.search(message.content)
+    # Bind the attributes touched repeatedly below to locals — the
+    # message.channel / message.content descriptor chains are re-walked on
+    # each access otherwise, and this runs per inbound message.
+    content = message.content
+    channel = message.channel
+    message_id = message.id
+
+    # Detect listings with <t:UNIX>. str.find does the cheap C-level scan for
+    # the literal prefix — almost all chat messages carry no timestamp — and
+    # the regex then only anchors at that offset instead of re-walking the
+    # whole message.
+    idx = content.find("<t:")
+    if idx == -1:
+        return
+    m = TIMESTAMP_REGEX.match(content, idx)
     if not m:
         return
 
     unix_time = int(m.group(1))
-    end_time = dt.datetime.fromtimestamp(unix_time, tz=pytz.UTC)
+    end_time = dt.datetime.fromtimestamp(unix_time, tz=UTC)
 
-    upsert_pending(str(message.id), str(message.id), str(message.channel.id), iso_utc(end_time))
+    await upsert_pending(str(message_id), str(message_id), str(channel.id), str(message.guild.id), iso_utc(end_time), unix_time)
 
-    await message.channel.send(
-        f"🛎 Potential auction detected for message `{message.id}` (ends <t:{unix_time}:R>). Confirm with `/track_auction {message.id}`."
+    await channel.send(
+        f"🛎 Potential auction detected for message `{message_id}` (ends <t:{unix_time}:R>). Confirm with `/track_auction {message_id}`."
     )
 
     # Schedule alerts if more than an hour away
-    now = dt.datetime.now(pytz.UTC)
+    now = dt.datetime.now(UTC)
     if end_time <= now + dt.timedelta(hours=1):
         return
     half_when = now + (end_time - now) / 2
     one_hour_when = end_time - dt.timedelta(hours=1)
-    scheduled_messages.add(message.id)
-    bot.scheduler.add_job(send_halfway_alert, "date", run_date=half_when, args=[message.channel.id, message.id])
-    bot.scheduler.add_job(send_one_hour_alert, "date", run_date=one_hour_when, args=[message.channel.id, message.id])
+    scheduled_messages[message_id] = True
+    await adb_exec("INSERT OR IGNORE INTO scheduled_alerts (message_id) VALUES (?)", (str(message_id),))
+    schedule_alerts(channel.id, message_id, half_when.timestamp(), one_hour_when.timestamp())
 
 @bot.event
 async def on_raw_reaction_add(payload: discord.RawReactionActionEvent):
-    # Only the confirm emoji counts
-    if str(getattr(payload.emoji, "id", None)) != CONFIRM_EMOJI_ID:
+    # Only the confirm emoji counts. Integer compare — unicode emoji have
+    # id None, so the common non-matching reaction is rejected without any
+    # allocation.
+    if payload.emoji.id != CONFIRM_EMOJI_ID:
         return
     if payload.user_id == bot.user.id:
         return
@@ -530,10 +899,14 @@ async def on_raw_reaction_add(payload: discord.RawReactionActionEvent):
     if not channel or channel.id not in AUCTION_CHANNEL_IDS:
         return
 
-    try:
-        message = await channel.fetch_message(payload.message_id)
-    except Exception:
-        return
+    # Someone just reacted to this message, so it's almost always still in
+    # the gateway message cache; only fall back to the REST fetch on a miss.
+    message = discord.utils.get(bot.cached_messages, id=payload.message_id)
+    if message is None:
+        try:
+            message = await channel.fetch_message(payload.message_id)
+        except Exception:
+            return
 
     bidder = message.author
     try:
@@ -543,7 +916,7 @@ async def on_raw_reaction_add(payload: discord.RawReactionActionEvent):
         return
 
     # Use the active auction for this channel
-    auction_id = auction_mgr.get_active_for_channel(channel.id)
+    auction_id = await auction_mgr.get_active_for_channel(channel.id)
     if not auction_id:
         await channel.send("⚠️ No active auction found for this channel. Please use `/track_auction <message_id>` first.")
         return
@@ -554,6 +927,14 @@ async def on_raw_reaction_add(payload: discord.RawReactionActionEvent):
 # Run
 # =========================
 if __name__ == '__main__':
+    # Optional: uvloop cuts per-coroutine and socket overhead noticeably.
+    # The default selector loop is fine where it isn't installed (Windows,
+    # bare Repl images), so treat it as strictly best-effort.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     from keep_alive import keep_alive  # if you use a keep_alive webserver (Repl/Render)
     init_db()
     keep_alive()